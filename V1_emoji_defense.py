@@ -22,32 +22,288 @@ Requirements:
     - The 'regex' package (install via: pip install regex)
 """
 
+import array
+import functools
+import sys
 import unicodedata
 import regex  # pip install regex
-from typing import Callable, Set, Optional, List
+from typing import Callable, FrozenSet, Set, Optional, List, Tuple
 
 # Pre-compiled regex patterns for performance.
 # EMOJI_PATTERN: Matches any emoji character based on Unicode properties.
 EMOJI_PATTERN = regex.compile(r'\p{Emoji}')
-# GRAPHEME_PATTERN: Matches extended grapheme clusters, handling combined characters.
+# GRAPHEME_PATTERN: Matches extended grapheme clusters, handling combined characters. It shares the
+# regex package's Grapheme_Cluster_Break tables with CLUSTER_SEGMENT_PATTERN below, so the two agree.
 GRAPHEME_PATTERN = regex.compile(r'\X')
+# Characters that can share a grapheme cluster with a neighbour: combining marks, joiners,
+# prepended marks, Hangul jamo and regional indicators (by their Grapheme_Cluster_Break value).
+_COMBINING_CLASS = (
+    r'\p{GCB=Extend}\p{GCB=ZWJ}\p{GCB=SpacingMark}\p{GCB=Prepend}'
+    r'\p{GCB=L}\p{GCB=V}\p{GCB=T}\p{GCB=Regional_Indicator}'
+)
+# COMBINING_PATTERN: Matches any single character of that class.
+COMBINING_PATTERN = regex.compile('[{0}]'.format(_COMBINING_CLASS))
+# CLUSTER_SEGMENT_PATTERN: Matches, in a single scan, every stretch of text that can hold a
+# multi-character grapheme cluster: runs of combining characters (with the characters between
+# and after them) and CRLF pairs. The character right before a run of combining characters
+# belongs to its first cluster as well; every other character is a cluster of its own.
+CLUSTER_SEGMENT_PATTERN = regex.compile(
+    r'[{0}]+(?:(?:\r\n|[^{0}])[{0}]+)*(?:\r\n|[^{0}])?|\r\n'.format(_COMBINING_CLASS)
+)
+
+# All 256 Latin-1 characters, and those among them that match EMOJI_PATTERN
+# (digits, '#', '*', '©' and '®').
+LATIN1_CHARACTERS = ''.join(map(chr, range(256)))
+LATIN1_EMOJI = ''.join(EMOJI_PATTERN.findall(LATIN1_CHARACTERS))
+
+# Bit flags recording which checks a single character fails on its own.
+FLAG_DISALLOWED = 0x01
+FLAG_DANGEROUS = 0x02
+FLAG_EMOJI = 0x04
 
 # Default set of disallowed/invisible code points.
-DEFAULT_DISALLOWED: Set[str] = {
+DEFAULT_DISALLOWED: FrozenSet[str] = frozenset({
     '\u200B',  # ZERO WIDTH SPACE
     '\u200C',  # ZERO WIDTH NON-JOINER
     '\u200D',  # ZERO WIDTH JOINER
     '\u2060',  # WORD JOINER
     '\uFE0E',  # VARIATION SELECTOR-15 (text presentation)
     '\uFE0F',  # VARIATION SELECTOR-16 (emoji presentation)
-}
+})
+
+# Every general category value known to unicodedata.
+_ALL_CATEGORIES = (
+    'Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Mn', 'Mc', 'Me', 'Nd', 'Nl', 'No',
+    'Pc', 'Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po', 'Sm', 'Sc', 'Sk', 'So',
+    'Zs', 'Zl', 'Zp', 'Cc', 'Cf', 'Cs', 'Co', 'Cn',
+)
 
 # Default dangerous Unicode categories (which may indicate non-standard usage).
-DEFAULT_DANGEROUS_CATEGORIES: Set[str] = {
+DEFAULT_DANGEROUS_CATEGORIES: FrozenSet[str] = frozenset({
     'Co',  # Private use
     'Cn',  # Unassigned
     'Cs',  # Surrogate
     'Cf',  # Format characters
+})
+
+
+def _all_characters() -> str:
+    """
+    Returns a string holding every code point from U+0000 to sys.maxunicode, in order.
+    """
+    code_points = array.array('I', range(sys.maxunicode + 1))
+    return code_points.tobytes().decode('utf-32-le' if sys.byteorder == 'little' else 'utf-32-be', 'surrogatepass')
+
+
+@functools.lru_cache(maxsize=16)
+def _merged(defaults: FrozenSet[str], extra: FrozenSet[str]) -> FrozenSet[str]:
+    """
+    Returns the union of a default set and caller-supplied extras, cached across calls.
+    """
+    return defaults | extra
+
+
+@functools.lru_cache(maxsize=16)
+def _blocked_characters(disallowed: FrozenSet[str], allow_emoji: bool) -> FrozenSet[str]:
+    """
+    Returns the characters that fail the disallowed or emoji check on their own, so that
+    both checks can be answered by a single set probe.
+    """
+    return disallowed if allow_emoji else disallowed | EMOJI_CHARACTERS
+
+
+@functools.lru_cache(maxsize=16)
+def _disallowed_translate_table(disallowed: FrozenSet[str], replacement: str) -> dict:
+    """
+    Returns a str.translate table mapping every disallowed character to the replacement string.
+    """
+    return {ord(ch): replacement for ch in disallowed if len(ch) == 1}
+
+
+@functools.lru_cache(maxsize=16)
+def _build_latin1_flags(disallowed: FrozenSet[str], dangerous_categories: FrozenSet[str]) -> bytes:
+    """
+    Builds a 256-entry lookup table holding the FLAG_* bits of every Latin-1 character
+    for the given disallowed characters and dangerous Unicode categories.
+    """
+    flags = bytearray(256)
+    for code_point, ch in enumerate(LATIN1_CHARACTERS):
+        if ch in disallowed:
+            flags[code_point] |= FLAG_DISALLOWED
+        if unicodedata.category(ch) in dangerous_categories:
+            flags[code_point] |= FLAG_DANGEROUS
+        if ch in LATIN1_EMOJI:
+            flags[code_point] |= FLAG_EMOJI
+    return bytes(flags)
+
+
+def _build_category_table(categories: FrozenSet[str], flag: int) -> Tuple[bytes, bytes]:
+    """
+    Builds a two-stage lookup table holding flag for every code point whose Unicode
+    category is in categories, and 0 for all others.
+
+    The first stage maps the high bits of a code point (cp >> 8) to a block number; the
+    second stage stores each distinct 256-code-point block once, one byte per code point.
+    A code point is probed with two subscripts: stage2[stage1[cp >> 8] << 8 | cp & 0xff].
+    """
+    flag_for_category = {name: flag if name in categories else 0 for name in _ALL_CATEGORIES}
+    flags = bytes(map(flag_for_category.__getitem__, map(unicodedata.category, _all_characters())))
+
+    stage1 = bytearray()
+    stage2 = bytearray()
+    block_numbers = {}
+    for start in range(0, len(flags), 256):
+        block = flags[start:start + 256]
+        if block not in block_numbers:
+            block_numbers[block] = len(block_numbers)
+            stage2 += block
+        stage1.append(block_numbers[block])
+    return bytes(stage1), bytes(stage2)
+
+
+@functools.lru_cache(maxsize=64)
+def _ascii_translate_table(latin1_flags: bytes, mask: int, replacement: str) -> dict:
+    """
+    Returns a str.translate table mapping every ASCII character whose flags intersect
+    mask to the replacement string.
+    """
+    return {code_point: replacement for code_point in range(128) if latin1_flags[code_point] & mask}
+
+
+# Flags of the Latin-1 characters under the default configuration, computed once at import.
+LATIN1_FLAGS = _build_latin1_flags(DEFAULT_DISALLOWED, DEFAULT_DANGEROUS_CATEGORIES)
+
+# FLAG_DANGEROUS for every code point in the default dangerous categories, computed once at import.
+DANGEROUS_STAGE1, DANGEROUS_STAGE2 = _build_category_table(DEFAULT_DANGEROUS_CATEGORIES, FLAG_DANGEROUS)
+
+# Every character matched by EMOJI_PATTERN, computed once at import.
+EMOJI_CHARACTERS: FrozenSet[str] = frozenset(EMOJI_PATTERN.findall(_all_characters()))
+
+# Joiners and variation selectors that are part of emoji ZWJ and presentation sequences. With
+# allow_emoji, they are not treated as disallowed inside a cluster matching EMOJI_SEQUENCE_PATTERN.
+EMOJI_SEQUENCE_CHARACTERS: FrozenSet[str] = frozenset({
+    '\u200D',  # ZERO WIDTH JOINER
+    '\uFE0E',  # VARIATION SELECTOR-15 (text presentation)
+    '\uFE0F',  # VARIATION SELECTOR-16 (emoji presentation)
+})
+
+# EMOJI_SEQUENCE_PATTERN: Matches a well-formed emoji sequence: emoji elements joined by single
+# U+200D characters, where an element is an emoji followed by at most one variation selector or
+# skin tone modifier, or a keycap ('#', '*' or a digit, an optional U+FE0F and U+20E3). Digits,
+# '#' and '*' only count as emoji inside a keycap.
+_EMOJI_ELEMENT = r'(?:[#*0-9]\uFE0F?\u20E3|(?![#*0-9])\p{Emoji}(?:[\uFE0E\uFE0F]|\p{EMod})?)'
+EMOJI_SEQUENCE_PATTERN = regex.compile(r'{0}(?:\u200D{0})*'.format(_EMOJI_ELEMENT))
+
+
+@functools.lru_cache(maxsize=16)
+def _make_cluster_checks(
+    latin1_flags: bytes,
+    mask: int,
+    blocked_characters: FrozenSet[str],
+    dangerous_categories: FrozenSet[str],
+) -> Tuple[Callable[[str], bool], Callable[[str], bool]]:
+    """
+    Returns the checks for one configuration: a function deciding whether a single character
+    fails checks 1-3, and one deciding whether a cluster of several characters fails checks 1-3.
+
+    Whether emoji and dangerous categories are checked is resolved here, once per configuration,
+    so the returned functions carry no per-call branches on the sanitizer's flags.
+    """
+    category = unicodedata.category
+    dangerous_stage1 = DANGEROUS_STAGE1
+    dangerous_stage2 = DANGEROUS_STAGE2
+    emoji_sequence_fullmatch = EMOJI_SEQUENCE_PATTERN.fullmatch
+    sequence_blocked_characters = blocked_characters - EMOJI_SEQUENCE_CHARACTERS
+    strict_mode = bool(mask & FLAG_DANGEROUS)
+
+    if not strict_mode:
+        def character_fails(ch: str) -> bool:
+            code_point = ord(ch)
+            if code_point < 256:
+                return bool(latin1_flags[code_point] & mask)
+            return ch in blocked_characters
+    elif dangerous_categories == DEFAULT_DANGEROUS_CATEGORIES:
+        # The default categories are answered by the precomputed two-stage table.
+        def character_fails(ch: str) -> bool:
+            code_point = ord(ch)
+            if code_point < 256:
+                return bool(latin1_flags[code_point] & mask)
+            if ch in blocked_characters:
+                return True
+            return bool(dangerous_stage2[dangerous_stage1[code_point >> 8] << 8 | code_point & 0xff])
+    else:
+        def character_fails(ch: str) -> bool:
+            code_point = ord(ch)
+            if code_point < 256:
+                return bool(latin1_flags[code_point] & mask)
+            return ch in blocked_characters or category(ch) in dangerous_categories
+
+    # Without FLAG_EMOJI in the mask (allow_emoji), a well-formed emoji sequence may keep its
+    # EMOJI_SEQUENCE_CHARACTERS; they are blocked anywhere else.
+    if mask & FLAG_EMOJI:
+        if strict_mode:
+            def cluster_blocked(cluster: str) -> bool:
+                return (not blocked_characters.isdisjoint(cluster)
+                        or not dangerous_categories.isdisjoint(map(category, cluster)))
+        else:
+            def cluster_blocked(cluster: str) -> bool:
+                return not blocked_characters.isdisjoint(cluster)
+    else:
+        if strict_mode:
+            def cluster_blocked(cluster: str) -> bool:
+                if not blocked_characters.isdisjoint(cluster) and (
+                    not sequence_blocked_characters.isdisjoint(cluster) or emoji_sequence_fullmatch(cluster) is None
+                ):
+                    return True
+                return not dangerous_categories.isdisjoint(map(category, cluster))
+        else:
+            def cluster_blocked(cluster: str) -> bool:
+                return not blocked_characters.isdisjoint(cluster) and (
+                    not sequence_blocked_characters.isdisjoint(cluster) or emoji_sequence_fullmatch(cluster) is None
+                )
+
+    return character_fails, cluster_blocked
+
+
+@functools.lru_cache(maxsize=16)
+def _configuration(
+    disallowed: FrozenSet[str],
+    dangerous_categories: FrozenSet[str],
+    allow_emoji: bool,
+    strict_mode: bool,
+    replacement: str,
+) -> Tuple[dict, Callable[[str], bool], Callable[[str], bool]]:
+    """
+    Returns the per-configuration state of sanitize_unicode: the str.translate table for ASCII
+    text and the two checks from _make_cluster_checks.
+    """
+    # Select the flags that cause a replacement under this configuration.
+    mask = FLAG_DISALLOWED
+    if not allow_emoji:
+        mask |= FLAG_EMOJI
+    if strict_mode:
+        mask |= FLAG_DANGEROUS
+
+    # Custom characters or categories invalidate the precomputed Latin-1 flags.
+    latin1_flags = LATIN1_FLAGS
+    if disallowed != DEFAULT_DISALLOWED or dangerous_categories != DEFAULT_DANGEROUS_CATEGORIES:
+        latin1_flags = _build_latin1_flags(disallowed, dangerous_categories)
+
+    ascii_table = _ascii_translate_table(latin1_flags, mask, replacement)
+    character_fails, cluster_blocked = _make_cluster_checks(
+        latin1_flags, mask, _blocked_characters(disallowed, allow_emoji), dangerous_categories
+    )
+    return ascii_table, character_fails, cluster_blocked
+
+
+# State for the default sets and an empty replacement, keyed by (allow_emoji, strict_mode),
+# computed once at import.
+DEFAULT_CONFIGURATIONS = {
+    (allow_emoji, strict_mode): _configuration(
+        DEFAULT_DISALLOWED, DEFAULT_DANGEROUS_CATEGORIES, allow_emoji, strict_mode, ''
+    )
+    for allow_emoji in (False, True)
+    for strict_mode in (False, True)
 }
 
 
@@ -73,19 +329,30 @@ def sanitize_unicode(
             - Disallowed invisible characters.
             - Presence of emoji (if allow_emoji is False).
             - Characters belonging to dangerous Unicode categories (when strict_mode is True).
-            - Prevention of token explosion (ensuring the cluster doesn’t tokenize into too many tokens).
+            - Prevention of token explosion (ensuring a cluster of several code points doesn’t
+              tokenize into too many tokens).
       4. Replacing any cluster that fails one or more of these checks with the specified replacement string.
 
+    Runs of ASCII text are handled on a fast path: outside of CRLF pairs every ASCII
+    character is a cluster of its own, so those runs are sanitized with a single
+    ``str.translate`` call and are not passed to the tokenizer. Likewise, grapheme segmentation
+    only runs on the stretches of text that can hold multi-character clusters (see
+    CLUSTER_SEGMENT_PATTERN); all other characters are checked once per distinct character.
+
     Args:
         text (str): The input Unicode string to sanitize.
         tokenizer (Callable[[str], List[str]]): A function that converts a string into a list of tokens.
-            Used to detect potential token explosion vulnerabilities.
+            Used to detect potential token explosion vulnerabilities. Clusters consisting of a
+            single code point are never tokenized.
         max_tokens (int, optional): Maximum allowed tokens per grapheme cluster.
             Defaults to 3.
         replacement (str, optional): String used to replace disallowed clusters.
             Defaults to an empty string.
         allow_emoji (bool, optional): If False, any grapheme cluster containing an emoji will be replaced.
-            If True, emojis are permitted (only filtering out explosive or combined cases if necessary).
+            If True, emojis are permitted (only filtering out explosive or combined cases if necessary),
+            and a cluster that is a well-formed emoji sequence (see EMOJI_SEQUENCE_PATTERN) may keep
+            its zero width joiners and variation selectors. In strict mode, the joiner's format
+            category still applies.
             Defaults to False.
         strict_mode (bool, optional): If True, perform additional filtering based on Unicode categories.
             Defaults to True.
@@ -105,48 +372,106 @@ def sanitize_unicode(
         "Hello World! Hidden text."
     """
     # Merge default and custom disallowed characters.
-    disallowed = DEFAULT_DISALLOWED.copy()
+    disallowed = DEFAULT_DISALLOWED
     if custom_disallowed:
-        disallowed.update(custom_disallowed)
+        disallowed = _merged(DEFAULT_DISALLOWED, frozenset(custom_disallowed))
 
     # Merge default and custom dangerous Unicode categories.
-    dangerous_categories = DEFAULT_DANGEROUS_CATEGORIES.copy()
+    dangerous_categories = DEFAULT_DANGEROUS_CATEGORIES
     if custom_dangerous_categories:
-        dangerous_categories.update(custom_dangerous_categories)
-
-    # Step 1: Normalize the text using NFKC (Normalization Form Compatibility Composition)
-    normalized_text = unicodedata.normalize('NFKC', text)
-
-    # Step 2: Split the normalized text into grapheme clusters.
-    clusters = GRAPHEME_PATTERN.findall(normalized_text)
-
-    sanitized_clusters = []
-
-    for cluster in clusters:
-        # Initialize flag to decide if the cluster should be replaced.
-        should_replace = False
-
-        # Check 1: Replace if the cluster contains any disallowed (invisible) characters.
-        if any(ch in disallowed for ch in cluster):
-            should_replace = True
-
-        # Check 2: If emojis are not allowed, replace any cluster containing an emoji.
-        elif not allow_emoji and EMOJI_PATTERN.search(cluster):
-            should_replace = True
-
-        # Check 3: In strict mode, replace if any character in the cluster belongs to a dangerous Unicode category.
-        elif strict_mode and any(unicodedata.category(ch) in dangerous_categories for ch in cluster):
-            should_replace = True
+        dangerous_categories = _merged(DEFAULT_DANGEROUS_CATEGORIES, frozenset(custom_dangerous_categories))
+
+    # Step 1: Normalize the text using NFKC (Normalization Form Compatibility Composition).
+    # NFKC leaves ASCII text unchanged, so pure ASCII input skips the normalization pass.
+    # unicodedata.normalize runs the NFKC quick check itself and returns already normalized
+    # input as is, so a separate unicodedata.is_normalized call would only scan the text twice.
+    normalized_text = text if text.isascii() else unicodedata.normalize('NFKC', text)
+
+    # Hoist hot lookups into locals for the cluster checks.
+    combining_search = COMBINING_PATTERN.search
+    cluster_segment_finditer = CLUSTER_SEGMENT_PATTERN.finditer
+    grapheme_findall = GRAPHEME_PATTERN.findall
+
+    # Look up the translate table for ASCII text and checks 1-3 for this configuration. The
+    # common call with default sets and an empty replacement uses the tables prepared at import.
+    if custom_disallowed or custom_dangerous_categories or replacement:
+        ascii_table, character_fails, cluster_blocked = _configuration(
+            disallowed, dangerous_categories, bool(allow_emoji), bool(strict_mode), replacement
+        )
+    else:
+        ascii_table, character_fails, cluster_blocked = DEFAULT_CONFIGURATIONS[bool(allow_emoji), bool(strict_mode)]
+
+    # Step 2: Pure ASCII text without CRLF pairs consists of single-character clusters only,
+    # so the cluster checks collapse into a single translation.
+    if normalized_text.isascii() and '\r\n' not in normalized_text:
+        return normalized_text.translate(ascii_table) if ascii_table else normalized_text
+
+    def cluster_fails(cluster: str) -> bool:
+        # Returns True if the grapheme cluster has to be replaced.
+
+        # A lone code point cannot stack up into a token explosion, so check 4 is skipped.
+        if len(cluster) == 1:
+            return character_fails(cluster)
+
+        # Checks 1-3: Replace if the cluster contains any disallowed (invisible) characters, any emoji
+        # if emojis are not allowed or, in strict mode, any character from a dangerous Unicode category.
+        if cluster_blocked(cluster):
+            return True
 
         # Check 4: Prevent token explosion by tokenizing the cluster. Replace if token count exceeds max_tokens.
-        elif len(tokenizer(cluster)) > max_tokens:
-            should_replace = True
-
-        # Append either the replacement or the original cluster.
-        sanitized_clusters.append(replacement if should_replace else cluster)
+        return len(tokenizer(cluster)) > max_tokens
+
+    # Step 3: Collect the distinct characters in one C-level pass. Each of them is checked once,
+    # and the failing ones are replaced with str.translate wherever they form a cluster on their own.
+    distinct_characters = set(normalized_text)
+    if allow_emoji and not strict_mode:
+        # Only disallowed characters can fail on their own, so the table is known up front and
+        # the per-character checks are skipped.
+        table = {} if disallowed.isdisjoint(distinct_characters) else _disallowed_translate_table(disallowed, replacement)
+    else:
+        table = {ord(ch): replacement for ch in distinct_characters if character_fails(ch)}
+
+    # Without combining characters or CRLF pairs every character is a cluster of its own, and the
+    # text is done: clean input is returned as is.
+    if combining_search(''.join(distinct_characters)) is None and not (
+        '\r' in distinct_characters and '\r\n' in normalized_text
+    ):
+        return normalized_text.translate(table) if table else normalized_text
+
+    # Step 4: Walk the grapheme clusters of every stretch of text that can hold a multi-character
+    # cluster, located in a single scan. Only failing clusters break the text up; everything between
+    # them is kept as one contiguous range and translated as a whole. A passing cluster contains no
+    # character from the table, except for emoji sequences keeping their EMOJI_SEQUENCE_CHARACTERS
+    # under allow_emoji; those break the range as well and are emitted as they are.
+    sequence_characters = EMOJI_SEQUENCE_CHARACTERS.intersection(distinct_characters) if allow_emoji else None
+    sanitized_parts = []
+    keep_start = 0
+    position = 0
+    for match in cluster_segment_finditer(normalized_text):
+        start, end = match.span()
+        # Pull in the base character in front of a run of combining characters.
+        if start > position and normalized_text[start] != '\r':
+            start -= 1
+        offset = start
+        for cluster in grapheme_findall(normalized_text, start, end):
+            cluster_end = offset + len(cluster)
+            if cluster_fails(cluster):
+                kept = normalized_text[keep_start:offset]
+                sanitized_parts.append(kept.translate(table) if table else kept)
+                sanitized_parts.append(replacement)
+                keep_start = cluster_end
+            elif sequence_characters and not sequence_characters.isdisjoint(cluster):
+                kept = normalized_text[keep_start:offset]
+                sanitized_parts.append(kept.translate(table) if table else kept)
+                sanitized_parts.append(cluster)
+                keep_start = cluster_end
+            offset = cluster_end
+        position = end
 
     # Reconstruct and return the sanitized text.
-    return ''.join(sanitized_clusters)
+    kept = normalized_text[keep_start:]
+    sanitized_parts.append(kept.translate(table) if table else kept)
+    return ''.join(sanitized_parts)
 
 
 def create_basic_tokenizer(max_length: int = 50) -> Callable[[str], List[str]]:
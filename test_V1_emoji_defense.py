@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the Unicode sanitizer in V1_emoji_defense.
+
+Run with: python -m unittest test_V1_emoji_defense
+"""
+
+import random
+import unicodedata
+import unittest
+from typing import Callable, List
+
+from V1_emoji_defense import (
+    DEFAULT_DANGEROUS_CATEGORIES,
+    DEFAULT_DISALLOWED,
+    EMOJI_PATTERN,
+    EMOJI_SEQUENCE_CHARACTERS,
+    EMOJI_SEQUENCE_PATTERN,
+    GRAPHEME_PATTERN,
+    create_basic_tokenizer,
+    sanitize_unicode,
+)
+
+
+def reference_sanitize(
+    text: str,
+    tokenizer: Callable[[str], List[str]],
+    max_tokens: int = 3,
+    replacement: str = '',
+    allow_emoji: bool = False,
+    strict_mode: bool = True,
+    custom_disallowed=None,
+    custom_dangerous_categories=None,
+) -> str:
+    """
+    Straightforward model of sanitize_unicode: normalizes the text, then checks every grapheme
+    cluster on its own, with none of the fast paths.
+    """
+    disallowed = set(DEFAULT_DISALLOWED) | set(custom_disallowed or ())
+    dangerous_categories = set(DEFAULT_DANGEROUS_CATEGORIES) | set(custom_dangerous_categories or ())
+    sanitized_parts = []
+    for cluster in GRAPHEME_PATTERN.findall(unicodedata.normalize('NFKC', text)):
+        cluster_disallowed = disallowed
+        if allow_emoji and EMOJI_SEQUENCE_PATTERN.fullmatch(cluster):
+            cluster_disallowed = disallowed - EMOJI_SEQUENCE_CHARACTERS
+        fails = (
+            any(ch in cluster_disallowed for ch in cluster)
+            or (not allow_emoji and EMOJI_PATTERN.search(cluster) is not None)
+            or (strict_mode and any(unicodedata.category(ch) in dangerous_categories for ch in cluster))
+            or (len(cluster) > 1 and len(tokenizer(cluster)) > max_tokens)
+        )
+        sanitized_parts.append(replacement if fails else cluster)
+    return ''.join(sanitized_parts)
+
+
+class EmojiSequenceTests(unittest.TestCase):
+    """Joiners and variation selectors with allow_emoji=True."""
+
+    def setUp(self):
+        self.tokenizer = create_basic_tokenizer()
+
+    def sanitize(self, text: str, strict_mode: bool = True) -> str:
+        return sanitize_unicode(text, self.tokenizer, max_tokens=10, allow_emoji=True, strict_mode=strict_mode)
+
+    def test_presentation_and_keycap_sequences_are_kept(self):
+        for text in ('\u2764\uFE0F ok', '1\uFE0F\u20E3', '#\uFE0F\u20E3', '\u00A9\uFE0F', '\U0001F44B\U0001F3FD'):
+            for strict_mode in (True, False):
+                self.assertEqual(self.sanitize(text, strict_mode), text)
+
+    def test_zwj_sequences(self):
+        for text in ('\u2764\uFE0F\u200D\U0001F525', '\U0001F468\u200D\U0001F469\u200D\U0001F467'):
+            self.assertEqual(self.sanitize(text, strict_mode=False), text)
+            # ZERO WIDTH JOINER is a format character (Cf), which strict mode still replaces.
+            self.assertEqual(self.sanitize(text, strict_mode=True), '')
+
+    def test_lone_joiners_and_selectors_are_stripped(self):
+        self.assertEqual(self.sanitize('a\u200Db'), 'b')
+        self.assertEqual(self.sanitize('\u200D\U0001F44B'), '\U0001F44B')
+        self.assertEqual(self.sanitize('a\uFE0F b'), ' b')
+        self.assertEqual(self.sanitize('\U0001F44B\u200D', strict_mode=False), '')
+
+    def test_selectors_outside_keycaps_are_stripped(self):
+        self.assertEqual(self.sanitize('1\uFE0F ok'), ' ok')
+        self.assertEqual(self.sanitize('5\u200D\uFE0F\u200D\uFE0E', strict_mode=False), '')
+
+    def test_stacked_selectors_are_stripped(self):
+        for strict_mode in (True, False):
+            self.assertEqual(self.sanitize('1' + '\uFE0E\uFE0F' * 20 + ' ok', strict_mode), ' ok')
+            self.assertEqual(self.sanitize('\U0001F44B' + '\uFE0F\uFE0E' * 30, strict_mode), '')
+
+    def test_sequences_are_replaced_without_allow_emoji(self):
+        self.assertEqual(sanitize_unicode('\u2764\uFE0F ok', self.tokenizer), ' ok')
+
+
+class ReferenceModelTests(unittest.TestCase):
+    """Randomized comparison of sanitize_unicode against reference_sanitize."""
+
+    CHARACTERS = (
+        list('abcXYZ  .,!?#*019-_') + ['\r', '\n', '\r\n', '\t', '\x00', '\x7f'] +
+        ['\u0301', '\u0300', '\u0308', '\u200B', '\u200C', '\u200D', '\u2060', '\uFE0E', '\uFE0F',
+         '\U0001F44B', '\U0001F468', '\U0001F30D', '\u2764', '\u263A', '\U0001F3FB', '\U0001F1FA',
+         '\U0001F1F8', '\u1100', '\u1161', '\u11A8', '\u0600', '\u0D4E', '\U000E0061', '\U000E007F',
+         '\uE000', '\u0378', '\u4E2D', '\u00E9', '\uFF21', '\uFB01', '\u00B2', '\u202E', '\u20E3',
+         '\u0E33', '\u0915', '\u094D', '\u0937', '\u0627', '\u00A0', '\u3000', '\u00A9', '\u00AD',
+         '\U0001F600', '\u00DF', '\u03A9', '\uFE00', '\U000E0100', '\u0903', '\uAC01', '\uFF76\uFF9E',
+         '\uD800', '\U0010FFFF', '\u1780', '\u17D2', '\u179A']
+    )
+    TOKENIZERS = {
+        'basic': create_basic_tokenizer(50),
+        'characters': list,
+        'bytes': lambda text: list(text.encode('utf-8', 'surrogatepass')),
+        'doubled_words': lambda text: text.split() * 2,
+    }
+
+    def test_matches_reference(self):
+        rnd = random.Random(0)
+        for _ in range(5000):
+            length = rnd.choice([1, 2, 3, 5, 10, 30])
+            if rnd.random() < 0.3:
+                text = ''.join(rnd.choice('abc de\n#1') for _ in range(length))
+            else:
+                text = ''.join(rnd.choice(self.CHARACTERS) for _ in range(length))
+            options = dict(
+                max_tokens=rnd.choice([1, 2, 3, 5]),
+                replacement=rnd.choice(['', '?', '#', '\u200B', 'XX']),
+                allow_emoji=rnd.random() < 0.5,
+                strict_mode=rnd.random() < 0.6,
+            )
+            if rnd.random() < 0.2:
+                options['custom_disallowed'] = set(rnd.sample(['a', '#', '\n', '\r', '\u4E2D', '\u0301', '\u00E9', '\u00A9'], 2))
+            if rnd.random() < 0.2:
+                options['custom_dangerous_categories'] = set(rnd.sample(['Cc', 'Mn', 'Lo', 'Nd', 'Po', 'Zs', 'So'], 2))
+            tokenizer = self.TOKENIZERS[rnd.choice(sorted(self.TOKENIZERS))]
+            with self.subTest(text=text, **options):
+                self.assertEqual(
+                    sanitize_unicode(text, tokenizer, **options),
+                    reference_sanitize(text, tokenizer, **options),
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()